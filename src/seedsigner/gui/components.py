@@ -4,8 +4,9 @@ import pathlib
 
 from dataclasses import dataclass
 from decimal import Decimal
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
-from typing import List, Tuple
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+from typing import ClassVar, List, Tuple
 
 from seedsigner.models import Singleton
 from seedsigner.models.settings import Settings
@@ -126,48 +127,27 @@ class SeedSignerCustomIconConstants:
 
 
 
-def calc_text_centering(font: ImageFont,
-                        text: str,
-                        is_text_centered: bool,
-                        total_width: int,
-                        total_height: int,
-                        start_x: int = 0,
-                        start_y: int = 0) -> Tuple[int, int]:
-    # see: https://pillow.readthedocs.io/en/stable/handbook/text-anchors.html#text-anchors
+class Icons(Singleton):
+    icon_path = os.path.join(pathlib.Path(__file__).parent.resolve(), "..", "resources", "icons")
+    icons = {}
 
-    # Gap between the starting coordinate and the first marking.
-    offset_x, offset_y = font.getoffset(text)
-
-    # Bounding box of the actual pixels rendered.
-    (box_left, box_top, box_right, box_bottom) = font.getbbox(text, anchor='lt')
-
-    # Ascender/descender are oversized ranges baked into the font.
-    ascent, descent = font.getmetrics()
-
-    # print(f"""----- "{text}" / {font.getname()} -----""")
-    # print(f"offset_x: {offset_x} | offset_y: {offset_y})")
-    # print(f"box_left: {box_left} |  box_top: {box_top} | box_right: {box_right} | box_bottom: {box_bottom}")
-    # print(f"ascent: {ascent} | descent: {descent})")
-
-    if is_text_centered:
-        text_x = int((total_width - (box_right - offset_x)) / 2) - offset_x
-    else:
-        text_x = GUIConstants.COMPONENT_PADDING
-
-    text_y = int((total_height - (ascent - offset_y)) / 2) - offset_y
-
-    return (start_x + text_x, start_y + text_y)
+    @classmethod
+    def get_icon(cls, icon_name: str) -> Image.Image:
+        # Cache already-decoded icons; they're read-only once loaded so all callers
+        # can share the same backing Image rather than re-reading the png from disk
+        # on every screen transition.
+        if icon_name not in cls.icons:
+            cls.icons[icon_name] = Image.open(os.path.join(cls.icon_path, f"{icon_name}.png")).convert("RGB")
+        return cls.icons[icon_name]
 
 
 
 def load_icon(icon_name: str, load_selected_variant: bool = False):
-    icon_url = os.path.join(pathlib.Path(__file__).parent.resolve(), "..", "resources", "icons", icon_name)
-    icon = Image.open(icon_url + ".png").convert("RGB")
+    icon = Icons.get_icon(icon_name)
     if not load_selected_variant:
         return icon
     else:
-        icon_selected = Image.open(icon_url + "_selected.png").convert("RGB")
-        return (icon, icon_selected)
+        return (icon, Icons.get_icon(icon_name + "_selected"))
 
 
 
@@ -182,6 +162,13 @@ class Fonts(Singleton):
     font_path = os.path.join(pathlib.Path(__file__).parent.resolve(), "..", "resources", "fonts")
     fonts = {}
 
+    # All UI text is ASCII/Latin; the BASIC layout engine skips libraqm's
+    # Unicode bidi/shaping pass, roughly halving getsize/draw.text cost.
+    try:
+        layout_engine = ImageFont.Layout.BASIC
+    except AttributeError:
+        layout_engine = ImageFont.LAYOUT_BASIC
+
     @classmethod
     def get_font(cls, font_name, size, file_extension: str = "ttf") -> ImageFont.FreeTypeFont:
         # Cache already-loaded fonts
@@ -193,13 +180,18 @@ class Fonts(Singleton):
         
         if size not in cls.fonts[font_name]:
             try:
-                cls.fonts[font_name][size] = ImageFont.truetype(os.path.join(cls.font_path, f"{font_name}.{file_extension}"), size)
+                font = ImageFont.truetype(os.path.join(cls.font_path, f"{font_name}.{file_extension}"), size, layout_engine=cls.layout_engine)
             except OSError as e:
                 if "cannot open resource" in str(e):
                     raise Exception(f"Font {font_name}.ttf not found: {repr(e)}")
                 else:
                     raise e
 
+            # Ascent/descent are constants per (font, size) yet getmetrics() costs a
+            # FreeType call; measure once at load time instead of per widget.
+            font.ascent, font.descent = font.getmetrics()
+            cls.fonts[font_name][size] = font
+
         return cls.fonts[font_name][size]
 
 
@@ -209,6 +201,53 @@ class TextDoesNotFitException(Exception):
 
 
 
+@lru_cache(maxsize=512)
+def _render_text_image(font_name: str, font_size: int, text: str, font_color: str, background_color: str) -> Image.Image:
+    """
+        Rasterizes `text` once into a tight Image that can then be cheaply `paste`d
+        wherever it's needed.
+
+        Labels, titles, and body text repeat constantly as the user navigates (and
+        every selection change redraws the same strings), so caching the rendered
+        text turns each redraw from a FreeType rasterization pass into a bitblt.
+
+        The image's baseline sits at the font's ascent; callers pasting against a
+        baseline y-coord should offset by the font's ascent.
+    """
+    font = Fonts.get_font(font_name, font_size)
+    ascent, descent = font.ascent, font.descent
+    (left, top, right, bottom) = font.getbbox(text)
+    img = Image.new("RGB", (max(right, 1), ascent + descent), background_color)
+    draw = ImageDraw.Draw(img)
+
+    # Default anchor is "la" (left, ascender) so the baseline lands at `ascent`
+    draw.text((0, 0), text, fill=font_color, font=font)
+    return img
+
+
+
+@lru_cache(maxsize=32)
+def _rounded_rectangle_image(width: int, height: int, fill: str, radius: int, outline: str, outline_width: int, background_color: str) -> Image.Image:
+    """
+        Rasterizes an anti-aliased rounded rect once per distinct size/color combo.
+
+        Buttons come in only a handful of sizes and exactly two color states, so
+        nearly every Button construction after the first is a cache hit. Callers
+        must `.copy()` the result before drawing onto it.
+    """
+    img = Image.new("RGB", (width + 1, height + 1), background_color)
+    draw = ImageDraw.Draw(img)
+    draw.rounded_rectangle(
+        (0, 0, width, height),
+        fill=fill,
+        radius=radius,
+        outline=outline,
+        width=outline_width,
+    )
+    return img
+
+
+
 @dataclass
 class BaseComponent:
     image_draw: ImageDraw.ImageDraw = None
@@ -239,6 +278,138 @@ class BaseComponent:
 
 
 
+@lru_cache(maxsize=256)
+def _calc_text_layout(text: str,
+                      font_name: str,
+                      font_size: int,
+                      bounding_width: int,
+                      height: int,
+                      edge_padding: int,
+                      is_text_centered: bool,
+                      min_text_x: int,
+                      auto_line_break: bool,
+                      allow_text_overflow: bool) -> Tuple:
+    """
+        Calculates if and where to make line breaks in `text` so that it fits in
+        its bounding rect (plus accounting for edge padding) using its given font.
+
+        Memoized since the same (text, font, width) layouts recur every time the
+        user navigates back to a screen.
+
+        Returns (text_lines, text_width, text_y, height, text_font_height,
+        bbox_height) where text_lines is a tuple of (line_text, text_x) pairs.
+    """
+    font = Fonts.get_font(font_name, font_size)
+
+    # Use the font-wide ascent/descent (measured once at font load) for line
+    # heights instead of shaping the entire string through getbbox just to
+    # measure it; the per-string ink bbox also ignored "\n" which broke height
+    # calcs for text with embedded newlines.
+    text_font_height = font.ascent
+    bbox_height = text_font_height + font.descent
+
+    text_lines = []
+    text_width = 0
+    def _add_text_line(line_text, width):
+        nonlocal text_width
+        if is_text_centered:
+            text_x = int((bounding_width - width) / 2)
+        else:
+            text_x = edge_padding
+        if min_text_x is not None and text_x < min_text_x:
+            text_x = min_text_x
+        text_lines.append((line_text, text_x))
+
+        if width > text_width:
+            text_width = width
+
+    if "\n" not in text and (
+            not auto_line_break
+            or font.getlength(text) < bounding_width - (2 * edge_padding)):
+        # The whole text fits on one line
+        full_text_width = math.ceil(font.getlength(text))
+        _add_text_line(text, full_text_width)
+
+        if height is None:
+            text_y = text_font_height
+            height = bbox_height
+        else:
+            # Vertical starting point calc is easy in this case
+            text_y = text_font_height + int((height - text_font_height)/2)
+
+        text_width = full_text_width
+
+    else:
+        # Have to calc how to break text into multiple lines
+        if len(text.split()) == 1 and not allow_text_overflow:
+            # No whitespace chars to split on!
+            raise TextDoesNotFitException("Text cannot fit in target rect with this font/size")
+
+        # Greedy forward fit: append words until the next one would exceed the
+        # width budget. `getlength` measures each word exactly once, rather
+        # than re-shaping ever-longer joined strings as the old recursive
+        # binary search did.
+        max_line_width = bounding_width - (2 * edge_padding)
+
+        # Round widths up to whole pixels so the fit test below stays in pure
+        # int arithmetic (no float accumulation, conservatively never overflows
+        # the budget by a sub-pixel rounding error).
+        space_width = math.ceil(font.getlength(" "))
+
+        for line in text.split("\n"):
+            words = line.split()
+            if not words:
+                # It's a blank line
+                _add_text_line("", 0)
+                continue
+
+            # Measure every word exactly once, up front; the fit test below is
+            # then pure arithmetic on a running prefix sum of word + space widths.
+            word_widths = [math.ceil(font.getlength(word)) for word in words]
+
+            line_start = 0
+            line_width = 0
+            for i, word_width in enumerate(word_widths):
+                if i == line_start:
+                    line_width = word_width
+                    continue
+
+                test_width = line_width + space_width + word_width
+                if test_width > max_line_width:
+                    # Adding this word would overflow; finalize the current line.
+                    # Note: a single word that's too long for the budget is
+                    # accepted as-is and just renders off the edges.
+                    _add_text_line(" ".join(words[line_start:i]), line_width)
+                    line_start = i
+                    line_width = word_width
+                else:
+                    line_width = test_width
+            _add_text_line(" ".join(words[line_start:]), line_width)
+
+        # TODO: Don't render blank lines as full height
+        line_spacing = GUIConstants.BODY_LINE_SPACING
+        total_text_height = bbox_height * len(text_lines) + line_spacing * (len(text_lines) - 1)
+        if height is None:
+            # Autoscale height to text lines
+            height = total_text_height
+            text_y = text_font_height
+
+        else:
+            if total_text_height > height + 2*GUIConstants.COMPONENT_PADDING:
+                if not allow_text_overflow:
+                    raise TextDoesNotFitException("Text cannot fit in target rect with this font/size")
+                else:
+                    # Just let it render off the edge, but preserve the top portion
+                    text_y = text_font_height
+
+            else:
+                # Vertically center the multiline text's starting point
+                text_y = text_font_height + int((height - total_text_height)/2)
+
+    return (tuple(text_lines), text_width, text_y, height, text_font_height, bbox_height)
+
+
+
 @dataclass
 class TextArea(BaseComponent):
     """
@@ -265,7 +436,6 @@ class TextArea(BaseComponent):
     font_color: str = GUIConstants.BODY_FONT_COLOR
     edge_padding: int = GUIConstants.EDGE_PADDING
     is_text_centered: bool = True
-    supersampling_factor: int = 1
     auto_line_break: bool = True
     allow_text_overflow: bool = False
 
@@ -276,146 +446,58 @@ class TextArea(BaseComponent):
         if not self.width:
             self.width = self.canvas_width
 
-        if self.font_size < 18 and (not self.supersampling_factor or self.supersampling_factor == 1):
-            self.supersampling_factor = 2
+        # Full width of the bounding rect; self.width is reduced to the actual
+        #   rendered text width at the end for outside callers.
+        self.bounding_width = self.width
 
-        self.font = Fonts.get_font(self.font_name, int(self.supersampling_factor * self.font_size))
-        self.supersampled_width = self.supersampling_factor * self.width
-        if self.height is None:
-            self.supersampled_height = None
-        else:
-            self.supersampled_height = self.supersampling_factor * self.height
+        self.font = Fonts.get_font(self.font_name, self.font_size)
+        self.font_ascent, self.font_descent = self.font.ascent, self.font.descent
         self.line_spacing = GUIConstants.BODY_LINE_SPACING
 
-        # We have to figure out if and where to make line breaks in the text so that it
-        #   fits in its bounding rect (plus accounting for edge padding) using its given
-        #   font.
-        # Measure from left baseline ("ls")
-        # TODO: getbbox() seems to ignore "\n" so isn't properly factored into height
-        # calcs and yields incorrect full_text_width. For now must specify self.height to
-        # render properly. Centering will be wrong.
-        (left, top, full_text_width, bottom) = self.font.getbbox(self.text, anchor="ls")
-        self.text_font_height = -1 * top
-        self.bbox_height = self.text_font_height + bottom
+        # The same strings recur as the user navigates back and forth, so the
+        #   line-break calc itself is memoized.
+        (text_lines,
+         self.text_width,
+         self.text_y,
+         self.height,
+         self.text_font_height,
+         self.bbox_height) = _calc_text_layout(
+            text=self.text,
+            font_name=self.font_name,
+            font_size=self.font_size,
+            bounding_width=self.bounding_width,
+            height=self.height,
+            edge_padding=self.edge_padding,
+            is_text_centered=self.is_text_centered,
+            min_text_x=self.min_text_x,
+            auto_line_break=self.auto_line_break,
+            allow_text_overflow=self.allow_text_overflow,
+        )
 
         # Stores each line of text and its rendering starting x-coord
-        self.text_lines = []
-        self.text_width = 0
-        def _add_text_line(text, width):
-            if self.is_text_centered:
-                text_x = int((self.supersampled_width - width) / 2)
-            else:
-                text_x = self.supersampling_factor * self.edge_padding
-            if self.min_text_x is not None and text_x < self.min_text_x:
-                text_x = self.min_text_x
-            self.text_lines.append({"text": text, "text_x": text_x})
-
-            if width > self.text_width:
-                self.text_width = width
-
-        if not self.auto_line_break or full_text_width < self.supersampled_width - (2 * self.edge_padding * self.supersampling_factor):
-            # The whole text fits on one line
-            _add_text_line(self.text, full_text_width)
-
-            if self.height is None:
-                self.text_y = self.text_font_height
-                self.supersampled_height = self.bbox_height
-                self.height = int(self.bbox_height / self.supersampling_factor)
-            else:
-                # Vertical starting point calc is easy in this case
-                self.text_y = self.text_font_height + int((self.supersampled_height - self.text_font_height)/2)
-            
-            self.text_width = full_text_width
-
-        else:
-            # Have to calc how to break text into multiple lines
-            def _binary_len_search(min_index, max_index):
-                # Try the middle of the range
-                index = math.ceil((max_index + min_index) / 2)
-                if index == 0:
-                    # Handle edge case where there's only one word in the last line
-                    index = 1
-
-                tw, th = self.font.getsize(" ".join(words[0:index]))
-
-                if tw > self.supersampled_width - (2 * self.edge_padding * self.supersampling_factor):
-                    # Candidate line is still too long. Restrict search range down.
-                    if min_index + 1 == index:
-                        if index == 1:
-                            # It's just one long, unbreakable word. There's no good
-                            # solution here. Just accept it as is and let it render off
-                            # the edges.
-                            return (index, tw)
-                        else:
-                            # There's still room to back down the min_index in the next
-                            # round.
-                            index -= 1
-                    return _binary_len_search(min_index=min_index, max_index=index)
-                elif index == max_index:
-                    # We have converged
-                    return (index, tw)
-                else:
-                    # Candidate line is possibly shorter than necessary.
-                    return _binary_len_search(min_index=index, max_index=max_index)
-
-            if len(self.text.split()) == 1 and not self.allow_text_overflow:
-                # No whitespace chars to split on!
-                raise TextDoesNotFitException("Text cannot fit in target rect with this font/size")
-
-            for line in self.text.split("\n"):
-                words = line.split()
-                if not words:
-                    # It's a blank line
-                    _add_text_line("", 0)
-                else:
-                    while words:
-                        (index, tw) = _binary_len_search(0, len(words))
-                        _add_text_line(" ".join(words[0:index]), tw)
-                        words = words[index:]
-
-            # TODO: Don't render blank lines as full height
-            total_text_height = self.bbox_height * len(self.text_lines) + self.line_spacing * (len(self.text_lines) - 1)
-            if self.height is None:
-                # Autoscale height to text lines
-                self.supersampled_height = total_text_height
-                self.height = int(self.supersampled_height / self.supersampling_factor)
-                self.text_y = self.text_font_height
-
-            else:
-                self.supersampled_height = self.height * self.supersampling_factor
-                if total_text_height > self.height * self.supersampling_factor + 2*GUIConstants.COMPONENT_PADDING * self.supersampling_factor:
-                    if not self.allow_text_overflow:
-                        raise TextDoesNotFitException("Text cannot fit in target rect with this font/size")
-                    else:
-                        # Just let it render off the edge, but preserve the top portion
-                        self.text_y = self.text_font_height
-
-                else:
-                    # Vertically center the multiline text's starting point
-                    self.text_y = self.text_font_height + int((self.supersampled_height - total_text_height)/2)
-
-        # Make sure the width/height that get referenced outside this obj are
-        #   specified and restored to their normal scaling factor.
-        self.width = int(self.text_width / self.supersampling_factor)
-        self.text_font_height = int(self.text_font_height / self.supersampling_factor)
-
-
-    def render(self):
-        # Render to a temp img scaled up by self.supersampling_factor, then resize down
-        #   with bicubic resampling.
-        # TODO: Store resulting super-sampled image as a member var in __post_init__ and 
-        # just re-paste it here.
-        img = Image.new("RGB", (self.supersampled_width, self.supersampled_height), self.background_color)
-        draw = ImageDraw.Draw(img)
+        self.text_lines = [{"text": line_text, "text_x": text_x} for (line_text, text_x) in text_lines]
+
+        # Make sure the width that gets referenced outside this obj reflects the
+        #   actual rendered text width.
+        self.width = self.text_width
+
+        # Rasterize the whole block once, up front: draw every line into a single
+        #   monochrome mask, then composite the font color through it onto the
+        #   background. All of the FreeType work happens here at construction time;
+        #   render() is reduced to a single bitblt.
+        mask = Image.new("L", (self.bounding_width, self.height), 0)
+        mask_draw = ImageDraw.Draw(mask)
         cur_y = self.text_y
-
         for line in self.text_lines:
-            draw.text((line["text_x"], cur_y), line["text"], fill=self.font_color, font=self.font, anchor="ls")
+            mask_draw.text((line["text_x"], cur_y), line["text"], fill=255, font=self.font, anchor="ls")
             cur_y += self.bbox_height + self.line_spacing
 
-        resized = img.resize((int(self.supersampled_width / self.supersampling_factor), self.height), Image.LANCZOS)
-        resized = resized.filter(ImageFilter.SHARPEN)
-        self.canvas.paste(resized, (self.screen_x, self.screen_y))
+        self.rendered_image = Image.new("RGB", mask.size, self.background_color)
+        self.rendered_image.paste(self.font_color, (0, 0), mask)
+
+
+    def render(self):
+        self.canvas.paste(self.rendered_image, (self.screen_x, self.screen_y))
 
 
 
@@ -561,6 +643,23 @@ class IconTextLine(BaseComponent):
         self.width = self.canvas_width
 
 
+    def set_image_draw(self, image_draw: ImageDraw):
+        # Must propagate to the child components, which captured their own refs
+        #   at construction. The getattr guards cover the call from
+        #   BaseComponent.__post_init__, before the children exist.
+        super().set_image_draw(image_draw)
+        for component in [getattr(self, "label_textarea", None), getattr(self, "value_textarea", None), getattr(self, "icon", None)]:
+            if component:
+                component.set_image_draw(image_draw)
+
+
+    def set_canvas(self, canvas: Image):
+        super().set_canvas(canvas)
+        for component in [getattr(self, "label_textarea", None), getattr(self, "value_textarea", None), getattr(self, "icon", None)]:
+            if component:
+                component.set_canvas(canvas)
+
+
     def render(self):
         if self.label_textarea:
             self.label_textarea.render()
@@ -1013,7 +1112,6 @@ class BtcAmount(BaseComponent):
             font_name=GUIConstants.BODY_FONT_NAME,
             font_size=unit_font_size,
             font_color=GUIConstants.BODY_FONT_COLOR,
-            supersampling_factor=2,
             is_text_centered=False,
             edge_padding=0,
             screen_x=cur_x,
@@ -1108,6 +1206,13 @@ class Button(BaseComponent):
             else:
                 self.text_y = self.height - int((self.height - self.text_height)/2)
 
+            self.font_ascent, self.font_descent = self.font.ascent, self.font.descent
+
+            # Pre-render the label in both color states so each render() is just a
+            # paste rather than a fresh FreeType rasterization.
+            _render_text_image(self.font_name, self.font_size, self.text, self.font_color, self.background_color)
+            _render_text_image(self.font_name, self.font_size, self.text, self.selected_font_color, self.selected_color)
+
         # Preload the icon and its "_selected" variant
         if self.icon_name:
             icon_padding = GUIConstants.COMPONENT_PADDING
@@ -1144,9 +1249,27 @@ class Button(BaseComponent):
 
             self.right_icon_y = math.ceil((self.height - self.right_icon.height)/2)
 
+        self._render_button_images()
 
-    def render(self):
-        if self.is_selected:
+
+    def _render_button_images(self):
+        # Pre-render the Button's full appearance in both selection states so that
+        #   each render() is a single paste instead of re-drawing the rounded rect,
+        #   text, and icons. The mask keeps the pixels outside the rounded corners
+        #   untouched on the target canvas.
+        self.rendered_button = self._render_button_image(is_selected=False)
+        self.rendered_button_selected = self._render_button_image(is_selected=True)
+
+        self.rendered_button_mask = Image.new("L", self.rendered_button.size, 0)
+        ImageDraw.Draw(self.rendered_button_mask).rounded_rectangle(
+            (0, 0, self.width, self.height), fill=255, radius=8
+        )
+
+        self._rendered_text = self.text
+
+
+    def _render_button_image(self, is_selected: bool) -> Image.Image:
+        if is_selected:
             background_color = self.selected_color
             font_color = self.selected_font_color
             outline_color = self.selected_outline_color
@@ -1155,44 +1278,66 @@ class Button(BaseComponent):
             font_color = self.font_color
             outline_color = self.outline_color
 
-        self.image_draw.rounded_rectangle(
-            (
-                self.screen_x,
-                self.screen_y - self.scroll_y,
-                self.screen_x + self.width,
-                self.screen_y + self.height - self.scroll_y
-            ),
+        img = _rounded_rectangle_image(
+            self.width, self.height,
             fill=background_color,
             radius=8,
             outline=outline_color,
-            width=2,
-        )
+            outline_width=2,
+            background_color=GUIConstants.BACKGROUND_COLOR,
+        ).copy()
+        draw = ImageDraw.Draw(img)
 
         if self.text is not None:
-            self.image_draw.text(
-                (self.screen_x + self.text_x, self.screen_y + self.text_y - self.scroll_y),
-                self.text,
-                fill=font_color,
-                font=self.font,
-                anchor=self.text_anchor
-            )
+            text_img = _render_text_image(self.font_name, self.font_size, self.text, font_color, background_color)
+            if self.is_text_centered:
+                # Match the "ms" anchor: self.text_x is the label's midpoint
+                text_img_x = self.text_x - int(text_img.width/2)
+            else:
+                text_img_x = self.text_x
+            img.paste(text_img, (text_img_x, self.text_y - self.font_ascent))
 
         if self.icon_name:
-            icon = self.icon
-            if self.is_selected:
-                icon = self.icon_selected
-            icon.screen_y = self.screen_y + self.icon_y - self.scroll_y
-            icon.screen_x = self.screen_x + self.icon_x
+            icon = self.icon_selected if is_selected else self.icon
+            icon.set_image_draw(draw)
+            icon.set_canvas(img)
+            icon.screen_x = self.icon_x
+            icon.screen_y = self.icon_y
             icon.render()
 
         if self.right_icon_name:
-            icon = self.right_icon
-            if self.is_selected:
-                icon = self.right_icon_selected
-            icon.screen_y = self.screen_y + self.right_icon_y - self.scroll_y
-            icon.screen_x = self.screen_x + self.right_icon_x
+            icon = self.right_icon_selected if is_selected else self.right_icon
+            icon.set_image_draw(draw)
+            icon.set_canvas(img)
+            icon.screen_x = self.right_icon_x
+            icon.screen_y = self.right_icon_y
             icon.render()
 
+        return img
+
+
+    @property
+    def screen_bbox(self) -> Tuple[int, int, int, int]:
+        """ The Button's current on-screen rect, for dirty-rect partial flushes """
+        return (
+            self.screen_x,
+            self.screen_y - self.scroll_y,
+            self.screen_x + self.width + 1,
+            self.screen_y + self.height - self.scroll_y + 1
+        )
+
+
+    def render(self):
+        if self.text != self._rendered_text:
+            # Some screens relabel their soft key Buttons on the fly
+            self._render_button_images()
+
+        self.canvas.paste(
+            self.rendered_button_selected if self.is_selected else self.rendered_button,
+            (self.screen_x, self.screen_y - self.scroll_y),
+            self.rendered_button_mask
+        )
+
 
 
 @dataclass
@@ -1211,6 +1356,9 @@ class CheckedSelectionButton(Button):
             self.icon = None
             self.icon_selected = None
 
+            # Re-bake the pre-rendered states without the checkmark
+            self._render_button_images()
+
 
 
 @dataclass
@@ -1267,6 +1415,12 @@ class TopNav(BaseComponent):
     show_power_button: bool = False
     is_selected: bool = False
 
+    # The BACK/power buttons are identical chrome on every screen (the buttons'
+    #   pre-rendered states are immutable and is_selected is always set before
+    #   each render), so one shared instance per role serves all TopNavs.
+    _back_button: ClassVar[Button] = None
+    _power_button: ClassVar[Button] = None
+
 
     def __post_init__(self):
         super().__post_init__()
@@ -1276,24 +1430,30 @@ class TopNav(BaseComponent):
         self.font = Fonts.get_font(self.font_name, self.font_size)
 
         if self.show_back_button:
-            self.left_button = IconButton(
-                icon_name=SeedSignerCustomIconConstants.LARGE_CHEVRON_LEFT,
-                icon_size=GUIConstants.ICON_INLINE_FONT_SIZE,
-                screen_x=GUIConstants.EDGE_PADDING,
-                screen_y=GUIConstants.EDGE_PADDING,
-                width=GUIConstants.TOP_NAV_BUTTON_SIZE,
-                height=GUIConstants.TOP_NAV_BUTTON_SIZE,
-            )
+            if TopNav._back_button is None:
+                TopNav._back_button = IconButton(
+                    icon_name=SeedSignerCustomIconConstants.LARGE_CHEVRON_LEFT,
+                    icon_size=GUIConstants.ICON_INLINE_FONT_SIZE,
+                    screen_x=GUIConstants.EDGE_PADDING,
+                    screen_y=GUIConstants.EDGE_PADDING,
+                    width=GUIConstants.TOP_NAV_BUTTON_SIZE,
+                    height=GUIConstants.TOP_NAV_BUTTON_SIZE,
+                )
+            self.left_button = TopNav._back_button
 
         if self.show_power_button:
-            self.right_button = IconButton(
-                icon_name=FontAwesomeIconConstants.POWER_OFF,
-                icon_size=GUIConstants.ICON_INLINE_FONT_SIZE,
-                screen_x=self.width - GUIConstants.TOP_NAV_BUTTON_SIZE - GUIConstants.EDGE_PADDING,
-                screen_y=GUIConstants.EDGE_PADDING,
-                width=GUIConstants.TOP_NAV_BUTTON_SIZE,
-                height=GUIConstants.TOP_NAV_BUTTON_SIZE,
-            )
+            power_button_x = self.width - GUIConstants.TOP_NAV_BUTTON_SIZE - GUIConstants.EDGE_PADDING
+            if TopNav._power_button is None or TopNav._power_button.screen_x != power_button_x:
+                # screen_x depends on TopNav width, so only reuse on a match
+                TopNav._power_button = IconButton(
+                    icon_name=FontAwesomeIconConstants.POWER_OFF,
+                    icon_size=GUIConstants.ICON_INLINE_FONT_SIZE,
+                    screen_x=power_button_x,
+                    screen_y=GUIConstants.EDGE_PADDING,
+                    width=GUIConstants.TOP_NAV_BUTTON_SIZE,
+                    height=GUIConstants.TOP_NAV_BUTTON_SIZE,
+                )
+            self.right_button = TopNav._power_button
 
         min_x = 0
         if self.show_back_button:
@@ -1325,6 +1485,47 @@ class TopNav(BaseComponent):
                 font_size=self.font_size,
             )
 
+        self._render_nav_images()
+
+
+    def _render_nav_images(self):
+        # The title never changes after init, so pre-render the whole bar in both
+        #   selection states; each render() is then a single paste.
+        img = Image.new("RGB", (self.width, self.height), self.background_color)
+        draw = ImageDraw.Draw(img)
+
+        self.title.set_image_draw(draw)
+        self.title.set_canvas(img)
+        self.title.render()
+        self.title.set_image_draw(self.image_draw)
+        self.title.set_canvas(self.canvas)
+
+        self.rendered_nav = img
+        self.rendered_nav_selected = img.copy()
+
+        buttons = []
+        if self.show_back_button:
+            buttons.append(self.left_button)
+        if self.show_power_button:
+            buttons.append(self.right_button)
+        for button in buttons:
+            self.rendered_nav.paste(
+                button.rendered_button,
+                (button.screen_x, button.screen_y),
+                button.rendered_button_mask
+            )
+            self.rendered_nav_selected.paste(
+                button.rendered_button_selected,
+                (button.screen_x, button.screen_y),
+                button.rendered_button_mask
+            )
+
+
+    @property
+    def screen_bbox(self) -> Tuple[int, int, int, int]:
+        """ The TopNav's on-screen rect, for dirty-rect partial flushes """
+        return (0, 0, self.width, self.height)
+
 
     @property
     def selected_button(self):
@@ -1338,11 +1539,16 @@ class TopNav(BaseComponent):
 
 
     def render(self):
-        self.title.render()
-        self.render_buttons()
-    
+        self.canvas.paste(
+            self.rendered_nav_selected if self.is_selected else self.rendered_nav,
+            (0, 0)
+        )
+
 
     def render_buttons(self):
+        # Renders just the buttons to the live canvas; some screens (e.g. the
+        #   keyboard screens) overwrite the title area themselves and only need
+        #   the buttons refreshed on selection toggles.
         if self.show_back_button:
             self.left_button.is_selected = self.is_selected
             self.left_button.render()
@@ -1350,15 +1556,6 @@ class TopNav(BaseComponent):
             self.right_button.is_selected = self.is_selected
             self.right_button.render()
 
-        # self.image_draw.text(
-        #     (self.text_x, self.text_y),
-        #     self.text,
-        #     font=self.font,
-        #     fill=self.font_color,
-        #     stroke_width=1,
-        #     stroke_fill=GUIConstants.BACKGROUND_COLOR,
-        # )
-
 
 
 def linear_interp(a, b, t):
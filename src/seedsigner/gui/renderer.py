@@ -34,7 +34,7 @@ class Renderer(ConfigurableSingleton):
         renderer.draw = ImageDraw.Draw(renderer.canvas)
 
 
-    def show_image(self, image=None, alpha_overlay=None):
+    def show_image(self, image=None, alpha_overlay=None, bbox=None):
         if alpha_overlay:
             if image == None:
                 image = self.canvas
@@ -44,7 +44,19 @@ class Renderer(ConfigurableSingleton):
             # Always write to the current canvas, rather than trying to replace it
             self.canvas.paste(image)
 
-        self.disp.ShowImage(self.canvas, 0, 0)
+        if bbox:
+            # Dirty-rect partial flush: only transmit the changed window over SPI
+            # rather than the full framebuffer.
+            x0 = max(0, bbox[0])
+            y0 = max(0, bbox[1])
+            x1 = min(self.canvas_width, bbox[2])
+            y1 = min(self.canvas_height, bbox[3])
+            if x1 <= x0 or y1 <= y0:
+                # Degenerate rect; nothing visible changed
+                return
+            self.disp.ShowImage(self.canvas.crop((x0, y0, x1, y1)), x0, y0)
+        else:
+            self.disp.ShowImage(self.canvas, 0, 0)
 
 
     def show_image_pan(self, image, start_x, start_y, end_x, end_y, rate, alpha_overlay=None):
@@ -10,7 +10,7 @@ from seedsigner.models import DecodeQR, DecodeQRStatus
 from seedsigner.models.threads import BaseThread
 
 from .screen import BaseScreen, BaseTopNavScreen, ButtonListScreen
-from ..components import BaseComponent, Button, GUIConstants, Fonts, IconButton, TextArea, calc_text_centering
+from ..components import BaseComponent, Button, GUIConstants, Fonts, IconButton, TextArea
 
 
 
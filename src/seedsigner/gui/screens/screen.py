@@ -22,6 +22,17 @@ RET_CODE__POWER_BUTTON = 1001
 
 
 
+def merge_bboxes(*bboxes) -> Tuple[int, int, int, int]:
+    """ Union of the given (x0, y0, x1, y1) dirty rects """
+    return (
+        min(bbox[0] for bbox in bboxes),
+        min(bbox[1] for bbox in bboxes),
+        max(bbox[2] for bbox in bboxes),
+        max(bbox[3] for bbox in bboxes),
+    )
+
+
+
 @dataclass
 class BaseScreen(BaseComponent):
     def __post_init__(self):
@@ -241,13 +252,13 @@ class BaseTopNavScreen(BaseScreen):
 
                 elif self.top_nav.is_selected and user_input in HardwareButtonsConstants.KEYS__ANYCLICK:
                     return self.top_nav.selected_button
-                
+
                 else:
                     # Nothing to do with this input
                     continue
 
-                # Write the screen updates
-                self.renderer.show_image()
+                # Write the screen updates; only the TopNav changed
+                self.renderer.show_image(bbox=self.top_nav.screen_bbox)
 
 
 
@@ -424,6 +435,12 @@ class ButtonListScreen(BaseTopNavScreen):
             )
 
             with self.renderer.lock:
+                # Only flush to the display if a branch actually changed something;
+                # render_bbox further narrows the flush to the changed rect
+                # (None = flush the full frame).
+                dirty = False
+                render_bbox = None
+
                 if not self.top_nav.is_selected and (
                         user_input == HardwareButtonsConstants.KEY_LEFT or (
                             user_input == HardwareButtonsConstants.KEY_UP and self.selected_button == 0
@@ -440,11 +457,18 @@ class ButtonListScreen(BaseTopNavScreen):
                         self.top_nav.is_selected = True
                         self.top_nav.render_buttons()
 
+                        dirty = True
+                        render_bbox = merge_bboxes(
+                            self.buttons[self.selected_button].screen_bbox,
+                            self.top_nav.screen_bbox
+                        )
+
                 elif user_input == HardwareButtonsConstants.KEY_UP:
                     if self.top_nav.is_selected:
                         # Can't go up any further
                         pass
                     else:
+                        dirty = True
                         cur_selected_button: Button = self.buttons[self.selected_button]
                         self.selected_button -= 1
                         next_selected_button: Button = self.buttons[self.selected_button]
@@ -459,6 +483,10 @@ class ButtonListScreen(BaseTopNavScreen):
                         else:
                             cur_selected_button.render()
                             next_selected_button.render()
+                            render_bbox = merge_bboxes(
+                                cur_selected_button.screen_bbox,
+                                next_selected_button.screen_bbox
+                            )
 
                 elif user_input == HardwareButtonsConstants.KEY_DOWN or (
                         self.top_nav.is_selected and user_input == HardwareButtonsConstants.KEY_RIGHT
@@ -470,6 +498,7 @@ class ButtonListScreen(BaseTopNavScreen):
                         if not self.top_nav.is_selected:
                             continue
 
+                    dirty = True
                     if self.top_nav.is_selected:
                         self.top_nav.is_selected = False
                         self.top_nav.render_buttons()
@@ -496,6 +525,16 @@ class ButtonListScreen(BaseTopNavScreen):
                     else:
                         if cur_selected_button:
                             cur_selected_button.render()
+                            render_bbox = merge_bboxes(
+                                cur_selected_button.screen_bbox,
+                                next_selected_button.screen_bbox
+                            )
+                        else:
+                            # We just dropped down out of the top_nav
+                            render_bbox = merge_bboxes(
+                                self.top_nav.screen_bbox,
+                                next_selected_button.screen_bbox
+                            )
                         next_selected_button.render()
 
                 elif user_input in HardwareButtonsConstants.KEYS__ANYCLICK:
@@ -504,7 +543,8 @@ class ButtonListScreen(BaseTopNavScreen):
                     return self.selected_button
 
                 # Write the screen updates
-                self.renderer.show_image()
+                if dirty:
+                    self.renderer.show_image(bbox=render_bbox)
 
 
 
@@ -572,12 +612,15 @@ class LargeButtonScreen(BaseTopNavScreen):
 
 
     def _run(self):
-        def swap_selected_button(new_selected_button: int):
-            self.buttons[self.selected_button].is_selected = False
-            self.buttons[self.selected_button].render()
+        def swap_selected_button(new_selected_button: int) -> Tuple[int,int,int,int]:
+            cur_button = self.buttons[self.selected_button]
+            cur_button.is_selected = False
+            cur_button.render()
             self.selected_button = new_selected_button
-            self.buttons[self.selected_button].is_selected = True
-            self.buttons[self.selected_button].render()
+            next_button = self.buttons[self.selected_button]
+            next_button.is_selected = True
+            next_button.render()
+            return merge_bboxes(cur_button.screen_bbox, next_button.screen_bbox)
 
         while True:
             ret = self._run_callback()
@@ -596,6 +639,10 @@ class LargeButtonScreen(BaseTopNavScreen):
             )
 
             with self.renderer.lock:
+                # Every mutating branch merges its changed rects into render_bbox;
+                # a no-op input leaves it None and skips the SPI write entirely.
+                render_bbox = None
+
                 if user_input == HardwareButtonsConstants.KEY_UP:
                     if self.selected_button in [0, 1]:
                         # Move selection up to top_nav
@@ -605,8 +652,10 @@ class LargeButtonScreen(BaseTopNavScreen):
                         self.buttons[self.selected_button].is_selected = False
                         self.buttons[self.selected_button].render()
 
+                        render_bbox = merge_bboxes(self.top_nav.screen_bbox, self.buttons[self.selected_button].screen_bbox)
+
                     elif len(self.buttons) == 4:
-                        swap_selected_button(self.selected_button - 2)
+                        render_bbox = swap_selected_button(self.selected_button - 2)
 
                 elif user_input == HardwareButtonsConstants.KEY_DOWN:
                     if self.top_nav.is_selected:
@@ -616,15 +665,17 @@ class LargeButtonScreen(BaseTopNavScreen):
                         self.buttons[self.selected_button].is_selected = True
                         self.buttons[self.selected_button].render()
 
+                        render_bbox = merge_bboxes(self.top_nav.screen_bbox, self.buttons[self.selected_button].screen_bbox)
+
                     elif self.selected_button in [2, 3]:
                         pass
                     elif len(self.buttons) == 4:
-                        swap_selected_button(self.selected_button + 2)
+                        render_bbox = swap_selected_button(self.selected_button + 2)
 
                 elif user_input == HardwareButtonsConstants.KEY_RIGHT and not self.top_nav.is_selected:
                     if self.selected_button in [0, 2]:
-                        swap_selected_button(self.selected_button + 1)
-                
+                        render_bbox = swap_selected_button(self.selected_button + 1)
+
                 elif (user_input == HardwareButtonsConstants.KEY_RIGHT and
                         self.top_nav.is_selected and not self.top_nav.show_power_button
                     ):
@@ -634,9 +685,11 @@ class LargeButtonScreen(BaseTopNavScreen):
                     self.buttons[self.selected_button].is_selected = True
                     self.buttons[self.selected_button].render()
 
+                    render_bbox = merge_bboxes(self.top_nav.screen_bbox, self.buttons[self.selected_button].screen_bbox)
+
                 elif user_input == HardwareButtonsConstants.KEY_LEFT and not self.top_nav.is_selected:
                     if self.selected_button in [1, 3]:
-                        swap_selected_button(self.selected_button - 1)
+                        render_bbox = swap_selected_button(self.selected_button - 1)
                     else:
                         # Left from the far edge takes us up to the BACK arrow
                         if self.top_nav.show_back_button:
@@ -646,13 +699,16 @@ class LargeButtonScreen(BaseTopNavScreen):
                             self.buttons[self.selected_button].is_selected = False
                             self.buttons[self.selected_button].render()
 
+                            render_bbox = merge_bboxes(self.top_nav.screen_bbox, self.buttons[self.selected_button].screen_bbox)
+
                 elif user_input in HardwareButtonsConstants.KEYS__ANYCLICK:
                     if self.top_nav.is_selected:
                         return self.top_nav.selected_button
                     return self.selected_button
 
                 # Write the screen updates
-                self.renderer.show_image()
+                if render_bbox:
+                    self.renderer.show_image(bbox=render_bbox)
 
 
 
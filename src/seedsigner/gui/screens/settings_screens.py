@@ -293,6 +293,5 @@ class DonateScreen(BaseTopNavScreen):
             text="seedsigner.com",
             font_size=GUIConstants.TOP_NAV_TITLE_FONT_SIZE + 8,
             font_color=GUIConstants.ACCENT_COLOR,
-            supersampling_factor=1,
             screen_y=self.components[-1].screen_y + self.components[-1].height + GUIConstants.COMPONENT_PADDING
         ))
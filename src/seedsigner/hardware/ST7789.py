@@ -148,20 +148,25 @@ class ST7789(object):
     
     def ShowImage(self,Image,Xstart,Ystart):
         """Set buffer to value of Python Imaging Library image."""
-        """Write display buffer to physical display"""
+        """Write display buffer to physical display; can be the full frame or a
+           partial window written at (Xstart, Ystart)"""
         imwidth, imheight = Image.size
-        if imwidth != self.width or imheight != self.height:
-            raise ValueError('Image must be same dimensions as display \
+        if Xstart + imwidth > self.width or Ystart + imheight > self.height:
+            raise ValueError('Image must fit within display \
                 ({0}x{1}).' .format(self.width, self.height))
-        img = np.asarray(Image)
-        pix = np.zeros((self.width,self.height,2), dtype = np.uint8)
-        pix[...,[0]] = np.add(np.bitwise_and(img[...,[0]],0xF8),np.right_shift(img[...,[1]],5))
-        pix[...,[1]] = np.add(np.bitwise_and(np.left_shift(img[...,[1]],3),0xE0),np.right_shift(img[...,[2]],3))
-        pix = pix.flatten().tolist()
-        self.SetWindows ( 0, 0, self.width, self.height)
+        # Pack RGB888 -> big-endian RGB565 in a single vectorized pass
+        img = np.asarray(Image, dtype=np.uint16)
+        pix = ((img[...,0] & 0xF8) << 8) | ((img[...,1] & 0xFC) << 3) | (img[...,2] >> 3)
+        buf = pix.astype('>u2').tobytes()
+        self.SetWindows ( Xstart, Ystart, Xstart + imwidth, Ystart + imheight)
         GPIO.output(self._dc,GPIO.HIGH)
-        for i in range(0,len(pix),4096):
-            self._spi.writebytes(pix[i:i+4096])		
+        if hasattr(self._spi, "writebytes2"):
+            # writebytes2 accepts a buffer directly and chunks internally
+            self._spi.writebytes2(buf)
+        else:
+            pix = list(buf)
+            for i in range(0,len(pix),4096):
+                self._spi.writebytes(pix[i:i+4096])
         
     def clear(self):
         """Clear contents of image buffer"""
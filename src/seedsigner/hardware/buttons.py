@@ -1,10 +1,15 @@
 from typing import List
 import RPi.GPIO as GPIO
+import threading
 import time
 
 from seedsigner.models.singleton import Singleton
 
 class HardwareButtons(Singleton):
+    # Set by the GPIO edge-detect callback; lets wait_for block idle instead of
+    #   polling. Class-level so the callback (called without self) can reach it.
+    edge_event = threading.Event()
+
     if GPIO.RPI_INFO['P1_REVISION'] == 3: #This indicates that we have revision 3 GPIO
         print("Detected 40pin GPIO (Rasbperry Pi 2 and above)")
         KEY_UP_PIN = 31
@@ -129,7 +134,15 @@ class HardwareButtons(Singleton):
                                 #   we let the repeats fly.
                                 pass
 
-            time.sleep(0.01) # wait 10 ms to give CPU chance to do other things
+            if self.has_any_input() or self.override_ind:
+                # A key is being held; keep polling at 10ms so the hold-to-repeat
+                #   timing above stays responsive.
+                time.sleep(0.01)
+            else:
+                # Idle; block until a GPIO edge fires. The timeout keeps the
+                #   screensaver-activation check at the top of the loop alive.
+                HardwareButtons.edge_event.wait(timeout=0.1)
+                HardwareButtons.edge_event.clear()
 
 
     def update_last_input_time(self):
@@ -138,11 +151,14 @@ class HardwareButtons(Singleton):
 
     def add_events(self, keys=[]):
         for key in keys:
-            GPIO.add_event_detect(key, self.GPIO.RISING, callback=HardwareButtons.rising_callback)
+            GPIO.add_event_detect(key, self.GPIO.BOTH, callback=HardwareButtons.edge_callback)
 
 
-    def rising_callback(channel):
-        HardwareButtonsConstants.release_lock = True
+    def edge_callback(channel):
+        if GPIO.input(channel) == GPIO.HIGH:
+            # Rising edge: button released
+            HardwareButtonsConstants.release_lock = True
+        HardwareButtons.edge_event.set()
 
 
     def trigger_override(self, force_release = False) -> bool:
@@ -151,6 +167,9 @@ class HardwareButtons(Singleton):
 
         if not self.override_ind:
             self.override_ind = True
+
+            # Wake any wait_for that's blocked on the edge event
+            HardwareButtons.edge_event.set()
             return True
         return False
 